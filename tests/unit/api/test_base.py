@@ -200,6 +200,88 @@ class TestTogglSet:
         assert obj is not None
         assert obj.some_field == 'asdf'
 
+    def test_get_detail_cached(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = {
+            'data': {
+                'some_field': 'asdf'
+            }
+        }
+
+        tset = base.TogglSet(RandomEntity)
+
+        assert tset.get(id=123, config=config).some_field == 'asdf'
+        assert tset.get(id='123', config=config).some_field == 'asdf'
+        assert utils.toggl.call_count == 1
+
+        tset.invalidate(123)
+        assert tset.get(id=123, config=config).some_field == 'asdf'
+        assert utils.toggl.call_count == 2
+
+    def test_get_cached(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = {
+            'data': {
+                'some_field': 'asdf'
+            }
+        }
+
+        tset = base.TogglSet(RandomEntity)
+        assert tset.get_cached(123, config=config) is None
+
+        tset.get(id=123, config=config)
+        assert tset.get_cached('123', config=config).some_field == 'asdf'
+        assert utils.toggl.call_count == 1
+
+    def test_prefetch(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = {
+            'data': {
+                'some_field': 'asdf'
+            }
+        }
+
+        tset = base.TogglSet(RandomEntity)
+        prefetched = tset.prefetch([1, 2, '2', None], config=config)
+        assert utils.toggl.call_count == 2
+        assert sorted(prefetched) == [1, 2]
+
+        assert tset.get(id=1, config=config).some_field == 'asdf'
+        assert tset.get(id=2, config=config).some_field == 'asdf'
+        assert utils.toggl.call_count == 2
+
+        # Cached IDs are resolved without fetching
+        assert tset.prefetch([1], config=config)[1].some_field == 'asdf'
+        assert utils.toggl.call_count == 2
+
+    def test_prefetch_failure(self, mocker):
+        def toggl(url, *args, **kwargs):
+            if url.endswith('/2'):
+                raise exceptions.TogglThrottlingException(429, 'Too many requests')
+
+            if url.endswith('/3'):
+                return {'data': None}
+
+            return {'data': {'some_field': 'asdf'}}
+
+        mocker.patch.object(utils, 'toggl', side_effect=toggl)
+
+        tset = base.TogglSet(RandomEntity)
+        prefetched = tset.prefetch([1, 2, 3], config=config)
+        assert utils.toggl.call_count == 3
+
+        # Not existing entity is resolved as None, failed ID is not resolved at all
+        assert prefetched[1].some_field == 'asdf'
+        assert prefetched[3] is None
+        assert 2 not in prefetched
+
+        # Failed ID is left to get()
+        assert tset.get(id=1, config=config).some_field == 'asdf'
+        assert utils.toggl.call_count == 3
+        with pytest.raises(exceptions.TogglThrottlingException):
+            tset.get(id=2, config=config)
+        assert utils.toggl.call_count == 4
+
     def test_get_detail_none(self, mocker):
         mocker.patch.object(utils, 'toggl')
         utils.toggl.return_value = {
@@ -304,6 +386,27 @@ class TestTogglSet:
         objs = tset.filter(some_field='asdf', id=2)
         assert len(objs) == 1
 
+    def test_filter_id(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = [
+            {
+                'id': 1,
+                'some_field': 'asdf'
+            },
+            {
+                'id': 2,
+                'some_field': 'mmm'
+            },
+        ]
+
+        tset = base.TogglSet(RandomEntity, can_get_detail=False)
+        objs = tset.filter(id='2')
+        assert len(objs) == 1
+        assert objs[0].some_field == 'mmm'
+
+        assert tset.filter(id=3) == []
+        assert tset.filter(id='not-id') == []
+
     def test_filter_contain(self, mocker):
         mocker.patch.object(utils, 'toggl')
         utils.toggl.return_value = [
@@ -673,3 +776,38 @@ class TestTogglEntity:
         obj._can_update = False
         with pytest.raises(exceptions.TogglException):
             obj.save()
+
+    def test_save_invalidates_cache(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = {
+            'data': {
+                'id': 333,
+                'string': 'asd'
+            }
+        }
+        Entity.objects.invalidate()
+
+        obj = Entity.objects.get(333, config=config)
+        Entity.objects.get(333, config=config)
+        assert utils.toggl.call_count == 1
+
+        obj.string = 'new'
+        obj.save()
+        assert utils.toggl.call_count == 2
+
+        Entity.objects.get(333, config=config)
+        assert utils.toggl.call_count == 3
+
+        obj.delete()
+        Entity.objects.get(333, config=config)
+        assert utils.toggl.call_count == 5
+
+    def test_get_not_found_not_cached(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = {
+            'data': None
+        }
+        Entity.objects.invalidate()
+
+        assert Entity.objects.get(444, config=config) is None
+        assert 444 not in Entity.objects._cache
@@ -360,6 +360,54 @@ class TestDateTimeField:
             pytest.fail('DateTimeField does not accept valid pendulum.DateTime object!')
 
 
+#########################################################################################
+# ChoiceField
+
+class ChoiceEntity(base.TogglEntity):
+    field = fields.ChoiceField({'a': 'Alpha', 'b': 'Beta', 'c': 'Alpha'})
+    list_field = fields.ChoiceField(['a', 'b'])
+
+
+class TestChoiceField:
+
+    def test_set_label(self):
+        instance = ChoiceEntity()
+
+        instance.field = 'Beta'
+        assert instance.field == 'b'
+
+        # Duplicate label resolves to the first key
+        instance.field = 'Alpha'
+        assert instance.field == 'a'
+
+    def test_set_key(self):
+        instance = ChoiceEntity()
+
+        instance.field = 'c'
+        assert instance.field == 'c'
+
+    def test_set_unknown(self):
+        instance = ChoiceEntity()
+
+        instance.field = 'Gamma'
+        assert instance.field == 'Gamma'
+
+        with pytest.raises(exceptions.TogglValidationException):
+            instance.__fields__['field'].validate(instance.field, instance)
+
+    def test_list_choices(self):
+        instance = ChoiceEntity()
+
+        instance.list_field = 'b'
+        assert instance.list_field == 'b'
+
+        instance.list_field = 'Beta'
+        assert instance.list_field == 'Beta'
+
+        with pytest.raises(exceptions.TogglValidationException):
+            instance.__fields__['list_field'].validate(instance.list_field, instance)
+
+
 #########################################################################################
 # ListField
 
@@ -423,6 +471,14 @@ class TestListField:
 
         assert len(instance.__change_dict__) == 1
 
+    def test_iteration(self):
+        instance = ListEntity(field=[1, 2, 3])
+
+        assert list(instance.field) == [1, 2, 3]
+        assert list(reversed(instance.field)) == [3, 2, 1]
+        assert 2 in instance.field
+        assert 4 not in instance.field
+
 
 #########################################################################################
 # SetField
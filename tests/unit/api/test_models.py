@@ -0,0 +1,94 @@
+import pendulum
+
+from toggl.api import models
+from toggl import utils
+
+from ... import helpers
+
+config = helpers.get_config()
+
+
+class TestTimeEntrySet:
+
+    def test_build_list_url(self):
+        start = pendulum.datetime(2019, 1, 2, 10, 0, tz='Europe/Prague')
+        stop = pendulum.datetime(2019, 1, 3, 10, 0, tz='Europe/Prague')
+
+        url = models.TimeEntry.objects.build_list_url('filter', config, {'start': start, 'stop': stop})
+        assert url == '/time_entries?start_date=2019-01-02T10%3A00%3A00%2B01%3A00' \
+                      '&end_date=2019-01-03T10%3A00%3A00%2B01%3A00'
+
+        assert models.TimeEntry.objects.build_list_url('filter', config, {}) == '/time_entries'
+
+    def test_build_reports_url(self):
+        start = pendulum.datetime(2019, 1, 2, 10, 0, tz='Europe/Prague')
+
+        url = models.TimeEntry.objects._build_reports_url(start, None, 1, 123)
+        assert url == '/details?user_agent=toggl_cli&workspace_id=123&page=1' \
+                      '&since=2019-01-02T10%3A00%3A00%2B01%3A00'
+
+    def test_all_from_reports(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = {
+            'data': [{
+                'id': 1,
+                'start': '2019-01-02T10:00:00+00:00',
+                'end': '2019-01-02T11:00:00+00:00',
+                'dur': 3600000,  # Reports API returns milliseconds
+                'description': 'entry',
+                'tags': [],
+                'pid': None,
+                'tid': None,
+                'uid': 2,
+                'billable': False,
+            }],
+            'per_page': 50,
+            'total_count': 1,
+        }
+
+        entries = list(models.TimeEntry.objects.all_from_reports(workspace=123, config=config))
+        assert len(entries) == 1
+        assert entries[0].duration == 3600
+        assert entries[0].stop == pendulum.datetime(2019, 1, 2, 11, 0)
+        assert utils.toggl.call_count == 1
+
+    def test_all_from_reports_empty(self, mocker):
+        mocker.patch.object(utils, 'toggl')
+        utils.toggl.return_value = {
+            'data': [],
+            'per_page': 50,
+            'total_count': 0,
+        }
+
+        assert list(models.TimeEntry.objects.all_from_reports(workspace=123, config=config)) == []
+
+
+class TestProjectUser:
+
+    @staticmethod
+    def toggl(url, *args, **kwargs):
+        if url == '/projects/1':
+            return {'data': {'id': 1, 'name': 'Proj'}}
+
+        if url.endswith('/users'):
+            return [{'id': 2, 'email': 'a@b.c'}]
+
+        return {'data': {'id': 3057440, 'name': 'Workspace'}}
+
+    def test_str(self, mocker):
+        mocker.patch.object(utils, 'toggl', side_effect=self.toggl)
+        models.Project.objects.invalidate()
+        models.User.objects.invalidate()
+
+        project_user = models.ProjectUser.deserialize(config=config, id=5, pid=1, uid=2, wid=3057440)
+
+        # Formatting must not issue any request, unresolved entities are represented by their IDs
+        assert str(project_user) == '#1/#2 (#5)'
+        assert utils.toggl.called is False
+
+        assert project_user.project.name == 'Proj'
+        assert project_user.user.email == 'a@b.c'
+        call_count = utils.toggl.call_count
+
+        assert str(project_user) == 'Proj/a@b.c (#5)'
+        assert utils.toggl.call_count == call_count
@@ -0,0 +1,47 @@
+from collections import namedtuple
+
+import pendulum
+import pytest
+
+from toggl.cli import commands
+from toggl import api
+
+from ... import helpers
+
+Context = namedtuple('Context', ['obj'])
+Entry = namedtuple('Entry', ['start', 'duration'])
+
+config = helpers.get_config()
+
+
+class TestGetEntries:
+
+    def test_reports_empty(self, mocker, capsys):
+        mocker.patch.object(api.TimeEntry.objects, 'all_from_reports', return_value=(entry for entry in []))
+
+        with pytest.raises(SystemExit) as e:
+            commands.get_entries(Context({'config': config}), True, start=None, stop=None)
+
+        assert e.value.code == 0
+        assert 'No entries were found!' in capsys.readouterr().out
+
+
+class TestGetTimesBasedOnDays:
+
+    def test_order_and_totals(self, mocker):
+        mocker.patch.object(pendulum, 'now', return_value=pendulum.datetime(2019, 1, 10, 12, 0))
+        running_start = pendulum.datetime(2019, 1, 10, 10, 0)
+
+        entries = [
+            Entry(pendulum.datetime(2019, 1, 2, 10, 0), 1800),
+            Entry(pendulum.datetime(2018, 12, 31, 10, 0), 3600),
+            Entry(running_start, -running_start.int_timestamp),
+            Entry(pendulum.datetime(2019, 1, 2, 15, 0), 1800),
+        ]
+
+        # Days are sorted chronologically (newest first) and not by their formatted string
+        assert commands.get_times_based_on_days(entries, config) == [
+            ('01/10/2019', 7200),
+            ('01/02/2019', 3600),
+            ('12/31/2018', 3600),
+        ]
@@ -0,0 +1,104 @@
+from toggl.api import base, fields
+from toggl.cli.helpers import fetch_mapped_fields, get_field_value
+from toggl import exceptions, utils
+
+from ... import helpers
+
+config = helpers.get_config()
+
+
+class DetailEntity(base.TogglEntity):
+    name = fields.StringField()
+
+
+class ListOnlyEntity(base.TogglEntity):
+    _can_get_detail = False
+
+    name = fields.StringField()
+
+
+DEFAULT_ENTITY = DetailEntity(name='Default', config=config)
+
+
+class LinkingEntity(base.TogglEntity):
+    detail = fields.MappingField(DetailEntity, 'did')
+    listed = fields.MappingField(ListOnlyEntity, 'lid')
+    defaulted = fields.MappingField(DetailEntity, 'dfid', default=lambda config: DEFAULT_ENTITY)
+
+
+def toggl(url, *args, **kwargs):
+    if url == '/detail_entitys/11':
+        raise exceptions.TogglNotFoundException(404, 'Not found')
+
+    if url.startswith('/detail_entitys/'):
+        eid = int(url.split('/')[-1])
+        return {'data': {'id': eid, 'name': 'D{}'.format(eid)}}
+
+    if url == '/list_only_entitys':
+        return [{'id': eid, 'name': 'L{}'.format(eid)} for eid in (1, 2, 3)]
+
+    raise AssertionError('Unexpected URL: ' + url)
+
+
+def linking_entity(**kwargs):
+    return LinkingEntity.deserialize(config=config, **kwargs)
+
+
+def format_value(entity, field_name, mapped):
+    return str(entity.__fields__[field_name].format(get_field_value(entity, field_name, mapped), config=config))
+
+
+class TestFetchMappedFields:
+
+    def setup_method(self):
+        DetailEntity.objects.invalidate()
+        ListOnlyEntity.objects.invalidate()
+
+    def test_detail(self, mocker):
+        mocker.patch.object(utils, 'toggl', side_effect=toggl)
+        entities = [linking_entity(id=1, did=1), linking_entity(id=2, did=1),
+                    linking_entity(id=3, did=2), linking_entity(id=4, did=11)]
+
+        mapped = fetch_mapped_fields(entities, ['detail'], config=config)
+
+        # Every distinct ID is requested exactly once, including the not existing one
+        assert utils.toggl.call_count == 3
+        assert sorted(mapped['detail']) == [1, 2, 11]
+
+        assert format_value(entities[0], 'detail', mapped) == 'D1 (#1)'
+        assert format_value(entities[2], 'detail', mapped) == 'D2 (#2)'
+        assert format_value(entities[3], 'detail', mapped) == ''
+        assert utils.toggl.call_count == 3
+
+    def test_list_only(self, mocker):
+        mocker.patch.object(utils, 'toggl', side_effect=toggl)
+        entities = [linking_entity(id=1, lid=1), linking_entity(id=2, lid=2), linking_entity(id=3, lid=2)]
+
+        mapped = fetch_mapped_fields(entities, ['listed'], config=config)
+
+        # The list is downloaded only once for all the IDs
+        assert utils.toggl.call_count == 1
+        assert sorted(mapped['listed']) == [1, 2]
+
+        assert format_value(entities[0], 'listed', mapped) == 'L1 (#1)'
+        assert format_value(entities[2], 'listed', mapped) == 'L2 (#2)'
+        assert utils.toggl.call_count == 1
+
+    def test_not_set(self, mocker):
+        mocker.patch.object(utils, 'toggl', side_effect=toggl)
+        entities = [linking_entity(id=1)]
+
+        mapped = fetch_mapped_fields(entities, ['detail', 'listed', 'defaulted'], config=config)
+
+        # Without IDs nothing is fetched and the descriptor's default is used
+        assert utils.toggl.call_count == 0
+        assert get_field_value(entities[0], 'defaulted', mapped) is DEFAULT_ENTITY
+        assert format_value(entities[0], 'detail', mapped) == ''
+        assert format_value(entities[0], 'listed', mapped) == ''
+
+    def test_no_mapped_fields(self, mocker):
+        mocker.patch.object(utils, 'toggl', side_effect=toggl)
+
+        assert fetch_mapped_fields([linking_entity(id=1, did=1)], ['id'], config=config) == {}
+        assert fetch_mapped_fields([], ['detail'], config=config) == {}
+        assert utils.toggl.call_count == 0
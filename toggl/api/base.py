@@ -4,6 +4,8 @@ import re
 import typing
 from abc import ABCMeta
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from inspect import Signature, Parameter
 
 from toggl import utils, exceptions
@@ -25,13 +27,9 @@ def evaluate_conditions(conditions, entity, contain=False):  # type: (typing.Dic
     :return:
     """
     for key, value in conditions.items():
-        try:
-            field = entity.__fields__[key]
-        except KeyError:
-            try:
-                field = entity.__mapped_fields__[key]
-            except KeyError:
-                return False
+        field = entity.__fields__.get(key) or entity.__mapped_fields__.get(key)
+        if field is None:
+            return False
 
         if isinstance(field, model_fields.MappingField):
             if isinstance(value, TogglEntity):
@@ -87,14 +85,17 @@ def evaluate_conditions(conditions, entity, contain=False):  # type: (typing.Dic
     return True
 
 
-# TODO: Caching
-class TogglSet(object):
+class TogglSet:
     """
     Class that is mainly responsible for fetching objects from the API.
 
     It is always binded to an entity class that represents entries which will be fetched from the API. The binding is
     done either passing the Entity's class to constructor or later on calling method bind_to_class. Without
     binded Entity the class can not perform any action.
+
+    Details of entities fetched by their ID are cached for the lifetime of the instance, so repeated lookups
+    (eq. resolving MappingFields of many entities) do not result in repeated API calls. The cache is invalidated
+    when the entity is saved or deleted, or it can be invalidated manually with invalidate() method.
     """
 
     def __init__(self, entity_cls=None, url=None, can_get_detail=None, can_get_list=None):  # type: (Entity, typing.Optional[str], typing.Optional[bool], typing.Optional[bool]) -> None
@@ -102,6 +103,7 @@ class TogglSet(object):
         self._url = url
         self._can_get_detail = can_get_detail
         self._can_get_list = can_get_list
+        self._cache = {}
 
     def bind_to_class(self, cls):  # type: (Entity) -> None
         """
@@ -147,6 +149,39 @@ class TogglSet(object):
         """
         return '/{}/{}'.format(self.base_url, eid)
 
+    @staticmethod
+    def _cache_key(eid):  # type: (typing.Any) -> typing.Any
+        """
+        Normalize ID into the form under which it is stored in the cache (eq. '123' and 123 are the same entity).
+        """
+        try:
+            return int(eid)
+        except (TypeError, ValueError):
+            return eid
+
+    def invalidate(self, eid=None):  # type: (typing.Any) -> None
+        """
+        Invalidates cached detail of the entity with given ID, or the whole cache if no ID is passed.
+        """
+        if eid is None:
+            self._cache = {}
+        else:
+            self._cache.pop(self._cache_key(eid), None)
+
+    def get_cached(self, id, config=None):  # type: (typing.Any, utils.Config) -> typing.Optional[Entity]
+        """
+        Returns the entity with given ID only if its detail is already cached, otherwise None.
+        Entities which do not have detail are cached when their listing is fetched.
+
+        Never makes any request, so it is safe to use for formatting (eq. in __str__).
+        """
+        config = config or utils.Config.factory()
+        data = self._cache.get(self._cache_key(id), {}).get(config)
+
+        if data is None:
+            return None
+
+        return self.entity_cls._deserialize(data, config)
 
     @property
     def can_get_detail(self):  # type: (TogglSet) -> bool
@@ -192,13 +227,19 @@ class TogglSet(object):
         config = config or utils.Config.factory()
 
         if id is not None:
+            # Entities without detail are cached from their listing, which can't be used with additional conditions
+            cached_entity = self.get_cached(id, config=config)
+            if cached_entity is not None and (self.can_get_detail or not conditions):
+                return cached_entity
+
             if self.can_get_detail:
                 try:
                     fetched_entity = utils.toggl(self.build_detail_url(id, config), 'get', config=config)
                     if fetched_entity['data'] is None:
                         return None
 
-                    return self.entity_cls.deserialize(config=config, **fetched_entity['data'])
+                    self._cache.setdefault(self._cache_key(id), {})[config] = fetched_entity['data']
+                    return self.entity_cls._deserialize(fetched_entity['data'], config)
                 except exceptions.TogglNotFoundException:
                     return None
             else:
@@ -217,6 +258,47 @@ class TogglSet(object):
 
         return entries[0]
 
+    def prefetch(self, ids, config=None):  # type: (typing.Iterable[typing.Any], utils.Config) -> typing.Dict[typing.Any, typing.Optional[Entity]]
+        """
+        Method that concurrently fetches details of entities with given IDs and stores them in the cache, so
+        following get() calls for these IDs are served without waiting for the API.
+
+        Returns dict 'ID' => entity (or None when the entity does not exist) of all resolved IDs. IDs which are
+        already cached are resolved from the cache, None IDs are skipped. If detail can not be fetched, nothing is done.
+        Prefetching is best-effort, IDs which failed to be fetched (eq. because of throttling) are not part
+        of the result and are left to be fetched by following get() calls.
+        """
+        if self.entity_cls is None:
+            raise exceptions.TogglException('The TogglSet instance is not binded to any TogglEntity!')
+
+        resolved = {}
+        if not self.can_get_detail:
+            return resolved
+
+        config = config or utils.Config.factory()
+        missing = []
+        for eid in {self._cache_key(eid) for eid in ids if eid is not None}:
+            entity = self.get_cached(eid, config=config)
+
+            if entity is None:
+                missing.append(eid)
+            else:
+                resolved[eid] = entity
+
+        def fetch(eid):
+            try:
+                resolved[eid] = self.get(eid, config=config)
+            except exceptions.TogglException as e:
+                logger.debug('Prefetching of {} #{} failed: {}'.format(self.entity_cls.__name__, eid, e))
+
+        if len(missing) == 1:
+            fetch(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(utils.MAX_CONCURRENT_REQUESTS, len(missing))) as executor:
+                list(executor.map(fetch, missing))
+
+        return resolved
+
     def _fetch_all(self, url, order, config):  # type: (str, str, utils.Config) -> typing.List[Entity]
         """
         Helper method that fetches all objects from given URL and deserialize them.
@@ -226,17 +308,16 @@ class TogglSet(object):
         if fetched_entities is None:
             return []
 
-        output = []
-        i = 0 if order == 'asc' else len(fetched_entities) - 1
-        while 0 <= i < len(fetched_entities):
-            output.append(self.entity_cls.deserialize(config=config, **fetched_entities[i]))
+        # The listing is the only source of details for these entities, so lets cache them for following get() calls
+        if not self.can_get_detail:
+            for entity in fetched_entities:
+                if entity.get('id') is not None:
+                    self._cache.setdefault(self._cache_key(entity['id']), {})[config] = entity
 
-            if order == 'asc':
-                i += 1
-            else:
-                i -= 1
+        if order != 'asc':
+            fetched_entities = reversed(fetched_entities)
 
-        return output
+        return [self.entity_cls._deserialize(entity, config) for entity in fetched_entities]
 
     def filter(self, order='asc', config=None, contain=False, **conditions):  # type: (str, utils.Config, bool, **typing.Any) -> typing.List[Entity]
         """
@@ -262,6 +343,15 @@ class TogglSet(object):
         if fetched_entities is None:
             return []
 
+        # ID lookups are resolved by direct comparison instead of evaluating all the conditions against every entity
+        if conditions.get('id') is not None:
+            try:
+                entity_id = int(conditions.pop('id'))
+            except (TypeError, ValueError):
+                return []
+
+            fetched_entities = [entity for entity in fetched_entities if entity.id == entity_id]
+
         # There are no specified conditions ==> return all
         if not conditions:
             return fetched_entities
@@ -464,6 +554,7 @@ class TogglEntity(metaclass=TogglEntityMeta):
         if self.id is not None:  # Update
             utils.toggl('/{}/{}'.format(self.get_url(), self.id), 'put', self.json(update=True), config=config)
             self.__change_dict__ = {}  # Reset tracking changes
+            self._invalidate_cache()
         else:  # Create
             data = utils.toggl('/{}'.format(self.get_url()), 'post', self.json(), config=config)
             self.id = data['data']['id']  # Store the returned ID
@@ -484,8 +575,16 @@ class TogglEntity(metaclass=TogglEntityMeta):
             raise exceptions.TogglException('This instance has not been saved yet!')
 
         utils.toggl('/{}/{}'.format(self.get_url(), self.id), 'delete', config=config or self._config)
+        self._invalidate_cache()
         self.id = None  # Invalidate the object, so when save() is called after delete a new object is created
 
+    def _invalidate_cache(self):  # type: () -> None
+        """
+        Invalidates cached detail of the entity in its TogglSet, so the next lookup returns fresh data.
+        """
+        if isinstance(self.objects, TogglSet):
+            self.objects.invalidate(self.id)
+
     def json(self, update=False):  # type: (bool) -> str
         """
         Serialize the entity into JSON string.
@@ -518,10 +617,7 @@ class TogglEntity(metaclass=TogglEntityMeta):
         source_dict = self.__change_dict__ if changes_only else self.__fields__
         entity_dict = {}
         for field_name in source_dict.keys():
-            try:
-                field = self.__fields__[field_name]
-            except KeyError:
-                field = self.__mapped_fields__[field_name]
+            field = self.__fields__.get(field_name) or self.__mapped_fields__[field_name]
 
             try:
                 value = field._get_value(self)
@@ -529,10 +625,7 @@ class TogglEntity(metaclass=TogglEntityMeta):
                 value = None
 
             if serialized:
-                try:
-                    entity_dict[field.mapped_field] = field.serialize(value)
-                except AttributeError:
-                    entity_dict[field.name] = field.serialize(value)
+                entity_dict[getattr(field, 'mapped_field', field.name)] = field.serialize(value)
             else:
                 entity_dict[field.name] = value
 
@@ -559,6 +652,7 @@ class TogglEntity(metaclass=TogglEntityMeta):
         return '{} (#{})'.format(getattr(self, 'name', None) or self.__class__.__name__, self.id)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def get_name(cls, verbose=False):  # type: (bool) -> str
         name = cls.__name__
         name = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
@@ -578,24 +672,31 @@ class TogglEntity(metaclass=TogglEntityMeta):
         """
         Method which takes kwargs as dict representing the Entity's data and return actuall instance of the Entity.
         """
-        try:
-            kwargs.pop('at')
-        except KeyError:
-            pass
+        return cls._deserialize(kwargs, config)
 
+    @classmethod
+    def _deserialize(cls, data, config=None):  # type: (typing.Dict, utils.Config) -> typing.Generic[Entity]
+        """
+        Same as deserialize(), but it takes directly the dict with the Entity's data, so it does not have to be copied
+        into kwargs. Used for deserialization of the API's responses. The passed dict is not modified.
+
+        Only keys corresponding to the Entity's fields are read (eq. 'at' and other unknown keys are ignored).
+        """
         instance = cls.__new__(cls)
         instance._config = config
         instance.__change_dict__ = {}
 
         for key, field in instance.__fields__.items():
-            try:
-                value = kwargs[key]
-            except KeyError:
-                try:
-                    value = kwargs[field.mapped_field]
-                except (KeyError, AttributeError):
+            # Most of the fields are usually missing in the API's data, so avoiding raising of exceptions for them
+            if key in data:
+                value = data[key]
+            else:
+                mapped_field = getattr(field, 'mapped_field', None)
+                if mapped_field is None or mapped_field not in data:
                     continue
 
+                value = data[mapped_field]
+
             field.init(instance, value)
 
         return instance
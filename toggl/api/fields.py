@@ -1,6 +1,5 @@
 import datetime
 import logging
-from builtins import int
 from copy import copy
 from enum import Enum
 from collections.abc import MutableSequence, MutableSet
@@ -489,13 +488,16 @@ class ChoiceField(StringField):
 
         self.choices = choices
 
+        # Reversed mapping label => key, for resolving choices entered by their label (first key wins)
+        self._labels = {}
+        if isinstance(choices, dict):
+            for key, label in choices.items():
+                self._labels.setdefault(label, key)
+
     def __set__(self, instance, value):  # type: (typing.Optional['base.Entity'], str) -> ChoiceField
         # User entered the choice's label and not the key, let's remap it
-        if value not in self.choices and isinstance(self.choices, dict):
-            for key, choice_value in self.choices.items():
-                if value == choice_value:
-                    value = key
-                    break
+        if self._labels and value not in self.choices:
+            value = self._labels.get(value, value)
 
         super().__set__(instance, value)
 
@@ -516,6 +518,9 @@ class ChoiceField(StringField):
 
 
 class ListContainer(MutableSequence):
+    # Containers (also SetContainer) are created for every entity's instance, so lets not waste memory on __dict__
+    __slots__ = ('_inner_list', '_instance', '_field_name')
+
     def __init__(self, entity_instance, field_name, existing_list=None):
         if existing_list is not None:
             self._inner_list = copy(existing_list)
@@ -528,6 +533,16 @@ class ListContainer(MutableSequence):
     def __len__(self):
         return len(self._inner_list)
 
+    # MutableSequence's mixin methods iterate through __getitem__ on Python level, lets use the inner list directly
+    def __iter__(self):
+        return iter(self._inner_list)
+
+    def __reversed__(self):
+        return reversed(self._inner_list)
+
+    def __contains__(self, value):
+        return value in self._inner_list
+
     def __delitem__(self, index):
         self._instance.__change_dict__[self._field_name] = self
         self._inner_list.__delitem__(index)
@@ -591,6 +606,8 @@ class ListField(TogglField[ListType]):
 
 
 class SetContainer(MutableSet):
+    __slots__ = ('_inner_set', '_instance', '_field_name')
+
     def __init__(self, entity_instance, field_name, existing_set=None):
         if existing_set is not None:
             if isinstance(existing_set, list):
@@ -615,7 +632,7 @@ class SetContainer(MutableSet):
         return x in self._inner_set
 
     def __iter__(self):
-        return self._inner_set.__iter__()
+        return iter(self._inner_set)
 
     def __len__(self):
         return len(self._inner_set)
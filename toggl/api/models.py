@@ -2,7 +2,7 @@ import json
 import logging
 import typing
 from copy import copy
-from urllib.parse import quote_plus
+from urllib.parse import urlencode
 from validate_email import validate_email
 
 import datetime
@@ -222,7 +222,7 @@ class UserSet(base.WorkspaceTogglSet):
         Fetches details about the current user.
         """
         fetched_entity = utils.toggl('/me', 'get', config=config)
-        return self.entity_cls.deserialize(config=config, **fetched_entity['data'])
+        return self.entity_cls._deserialize(fetched_entity['data'], config)
 
 
 class User(WorkspacedEntity):
@@ -339,7 +339,7 @@ class User(WorkspacedEntity):
             'created_with': created_with
         }})
         data = utils.toggl("/signups", "post", user_json, config=config)
-        return cls.deserialize(config=config, **data['data'])
+        return cls._deserialize(data['data'], config)
 
     def is_admin(self, workspace):
         wid = workspace.id if isinstance(workspace, Workspace) else workspace
@@ -418,7 +418,16 @@ class ProjectUser(WorkspacedEntity):
     """
 
     def __str__(self):
-        return '{}/{} (#{})'.format(self.project.name, self.user.email, self.id)
+        # Resolving the mapped fields would issue requests, so only already cached entities are used for formatting
+        pid, uid = self.__dict__.get('pid'), self.__dict__.get('uid')
+        project = Project.objects.get_cached(pid, config=self._config)
+        user = User.objects.get_cached(uid, config=self._config)
+
+        return '{}/{} (#{})'.format(
+            project.name if project is not None else '#{}'.format(pid),
+            user.email if user is not None else '#{}'.format(uid),
+            self.id
+        )
 
 
 class Task(PremiumEntity):
@@ -490,10 +499,11 @@ class TimeEntryDateTimeField(fields.DateTimeField):
 
         if instance is not None and only_time_for_same_day:
             config = config or utils.Config.factory()
+            timezone = config.timezone
+            value_in_timezone = value.in_timezone(timezone)
 
-            if value.in_timezone(config.timezone).to_date_string() == only_time_for_same_day.in_timezone(
-                config.timezone).to_date_string():
-                return value.in_timezone(config.timezone).format(config.time_format)
+            if value_in_timezone.date() == only_time_for_same_day.in_timezone(timezone).date():
+                return value_in_timezone.format(config.time_format)
 
         return super().format(value, config)
 
@@ -507,7 +517,8 @@ def get_duration(name, instance):  # type: (str, base.Entity) -> int
     if instance.is_running:
         return instance.start.int_timestamp * -1
 
-    return int((instance.stop - instance.start).in_seconds())
+    # in_seconds() already returns int
+    return (instance.stop - instance.start).in_seconds()
 
 
 def set_duration(name, instance, value, init=False):  # type: (str, base.Entity, typing.Optional[int], bool) -> typing.Optional[bool]
@@ -560,17 +571,19 @@ class TimeEntrySet(base.TogglSet):
         url = '/{}'.format(self.base_url)
 
         if caller == 'filter':
+            params = {}
             start = conditions.pop('start', None)
             stop = conditions.pop('stop', None)
 
-            if start is not None or stop is not None:
-                url += '?'
-
             if start is not None:
-                url += 'start_date={}&'.format(quote_plus(start.isoformat()))
+                params['start_date'] = start.isoformat()
 
             if stop is not None:
-                url += 'end_date={}&'.format(quote_plus(stop.isoformat()))
+                params['end_date'] = stop.isoformat()
+
+            # ISO timestamps contain '+' of the timezone offset, which has to be encoded (urlencode uses quote_plus)
+            if params:
+                url += '?' + urlencode(params)
 
         return url
 
@@ -587,18 +600,22 @@ class TimeEntrySet(base.TogglSet):
         if fetched_entity.get('data') is None:
             return None
 
-        return self.entity_cls.deserialize(config=config, **fetched_entity['data'])
+        return self.entity_cls._deserialize(fetched_entity['data'], config)
 
     def _build_reports_url(self, start, stop, page, wid):
-        url = '/details?user_agent=toggl_cli&workspace_id={}&page={}'.format(wid, page)
+        params = {
+            'user_agent': 'toggl_cli',
+            'workspace_id': wid,
+            'page': page,
+        }
 
         if start is not None:
-            url += '&since={}'.format(quote_plus(start.isoformat()))
+            params['since'] = start.isoformat()
 
         if stop is not None:
-            url += '&until={}'.format(quote_plus(stop.isoformat()))
+            params['until'] = stop.isoformat()
 
-        return url
+        return '/details?' + urlencode(params)
 
     def _should_fetch_more(self, page, returned):  # type: (int, typing.Dict) -> bool
         return page * returned['per_page'] < returned['total_count']
@@ -608,7 +625,7 @@ class TimeEntrySet(base.TogglSet):
             'id': entity_dict['id'],
             'start': entity_dict['start'],
             'stop': entity_dict['end'],
-            'duration': entity_dict['dur'] / 1000,
+            'duration': entity_dict['dur'] // 1000,  # Reports API returns milliseconds
             'description': entity_dict['description'],
             'tags': entity_dict['tags'],
             'pid': entity_dict['pid'],
@@ -618,7 +635,7 @@ class TimeEntrySet(base.TogglSet):
             'billable': entity_dict['billable'],
         }
 
-        return self.entity_cls.deserialize(config=config, **entity)
+        return self.entity_cls._deserialize(entity, config)
 
     def all_from_reports(self, start=None, stop=None, workspace=None, config=None):  # type: (typing.Optional[datetime_type], typing.Optional[datetime_type], typing.Union[str, int, Workspace], typing.Optional[utils.Config]) -> typing.Generator[TimeEntry, None, None]
         """
@@ -3,7 +3,7 @@ import traceback
 import webbrowser
 import os
 import time
-from functools import reduce
+from collections import defaultdict
 
 import click
 import click_completion
@@ -193,11 +193,14 @@ def get_entries(ctx, use_reports, **conditions):
         else:
             entities = api.TimeEntry.objects.all(order='desc', config=ctx.obj['config'])
 
+    # Reports API returns generator, which would be always truthy
+    entities = list(entities)
+
     if not entities:
         click.echo('No entries were found!')
         exit(0)
 
-    entities = sorted(entities, key=lambda x: x.start, reverse=True)
+    entities.sort(key=lambda x: x.start, reverse=True)
     return entities
 
 
@@ -237,18 +240,23 @@ def entry_ls(ctx, fields, today, use_reports, **conditions):
             click.echo('You can\'t use --start or --stop parameters with --today parameter!', err=True)
             exit(2)
         conditions['start'] = pendulum.today()
-        conditions['stop'] = pendulum.tomorrow()
+        conditions['stop'] = conditions['start'].add(days=1)
 
     entities = get_entries(ctx, use_reports, **conditions)
+    mapped = helpers.fetch_mapped_fields(entities, fields, config)
 
     if ctx.obj.get('simple'):
+        lines = []
         if ctx.obj.get('header'):
-            click.echo('\t'.join([click.style(field.capitalize(), **theme.header) for field in fields]))
+            lines.append('\t'.join([click.style(field.capitalize(), **theme.header) for field in fields]))
 
         for entity in entities:
-            click.echo('\t'.join(
-                [str(entity.__fields__[field].format(getattr(entity, field, ''))) for field in fields]
+            lines.append('\t'.join(
+                [str(entity.__fields__[field].format(helpers.get_field_value(entity, field, mapped), config=config))
+                 for field in fields]
             ))
+
+        click.echo('\n'.join(lines))
         return
 
     table = PrettyTable()
@@ -275,7 +283,8 @@ def entry_ls(ctx, fields, today, use_reports, **conditions):
                     'only_time_for_same_day': entity.stop
                 }
 
-            value = str(entity.__fields__[field].format(getattr(entity, field, None), **extra_kwargs))
+            value = helpers.get_field_value(entity, field, mapped, None)
+            value = str(entity.__fields__[field].format(value, config=config, **extra_kwargs))
             row.append(value)
 
         table.add_row(row)
@@ -307,24 +316,27 @@ def entry_sum(ctx, use_reports, today, show_total, **conditions):
             click.echo('You can\'t use --start or --stop parameters with --today parameter!', err=True)
             exit(2)
         conditions['start'] = pendulum.today()
-        conditions['stop'] = pendulum.tomorrow()
+        conditions['stop'] = conditions['start'].add(days=1)
 
     entries = get_entries(ctx, use_reports, **conditions)
     sums_per_day = get_times_based_on_days(entries, config)
 
     if show_total:
-        sums_per_day.insert(0, ["total",
-                                reduce((lambda x, y: x + y), [duration for _, duration in sums_per_day])])
+        sums_per_day.insert(0, ["total", sum(duration for _, duration in sums_per_day)])
 
     table = PrettyTable()
     table.field_names = [click.style('Day', **theme.header), click.style('Total time', **theme.header)]
     table.border = False
     table.align = 'l'
 
+    today_date = pendulum.today()
+    today_string = today_date.format(config.date_format)
+    yesterday_string = today_date.subtract(days=1).format(config.date_format)
+
     for date, duration in sums_per_day:
-        if date == pendulum.today().format(config.date_format):
+        if date == today_string:
             date = 'today'
-        elif date == (pendulum.today() - pendulum.duration(days=1)).format(config.date_format):
+        elif date == yesterday_string:
             date = 'yesterday'
 
         table.add_row([date, helpers.format_duration(duration)])
@@ -353,8 +365,8 @@ def entry_goal(ctx, goal, timeoff, no_notification, **conditions):
         timeoff = 5
 
     conditions['start'] = pendulum.today()
-    conditions['stop'] = pendulum.tomorrow()
-    today = pendulum.today().format(config.date_format)
+    conditions['stop'] = conditions['start'].add(days=1)
+    today = conditions['start'].format(config.date_format)
     goal = helpers.parse_duration_string(goal)
 
     if goal is False:
@@ -390,21 +402,22 @@ def entry_goal(ctx, goal, timeoff, no_notification, **conditions):
 
 def get_times_based_on_days(entries, config):
     """ sums the passed time grouped by days """
-
-    def reducer(previous, current):
-        duration = current.duration
+    # Config's attribute lookup goes through several sources, so resolve the values only once
+    tz = config.tz
+    date_format = config.date_format
+    now = pendulum.now(tz=tz).int_timestamp  # Same point in time for all running entries
+    days = defaultdict(int)
+
+    for entry in entries:
+        duration = entry.duration
         if duration < 0:
-            duration = pendulum.now(tz=config.tz).int_timestamp + duration
+            duration = now + duration
 
-        date = current.start.in_timezone(config.tz).format(config.date_format)
-        if date in previous:
-            previous[date] = previous[date] + duration
-        else:
-            previous[date] = duration
-        return previous
+        # Grouping by date objects, so formatting is done only once per day and not per entry
+        days[entry.start.in_timezone(tz).date()] += duration
 
-    days = reduce(reducer, entries, dict()).items()
-    return sorted(days, key=lambda day: day[0], reverse=True)
+    return [(date.format(date_format), duration)
+            for date, duration in sorted(days.items(), key=lambda day: day[0], reverse=True)]
 
 
 @cli.command('rm', short_help='delete a time entry')
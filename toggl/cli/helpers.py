@@ -4,13 +4,14 @@ import pathlib
 import re
 import typing
 from collections.abc import Iterable
+from functools import lru_cache
 
 import click
 import pendulum
 from notifypy import Notify
 from prettytable import PrettyTable
 
-from toggl.api import base
+from toggl.api import base, fields as model_fields
 from toggl.cli.themes import themes
 
 logger = logging.getLogger('toggl.cli')
@@ -26,12 +27,17 @@ def entity_listing(cls, fields=('id', 'name',), obj=None):  # type: (typing.Unio
         click.echo('No entries were found!')
         exit(0)
 
+    mapped = fetch_mapped_fields(entities, fields, config)
+
     if obj.get('simple'):
+        lines = []
         if obj.get('header'):
-            click.echo('\t'.join([click.style(field.capitalize(), **theme.header) for field in fields]))
+            lines.append('\t'.join([click.style(field.capitalize(), **theme.header) for field in fields]))
 
         for entity in entities:
-            click.echo('\t'.join([str(entity.__fields__[field].format(getattr(entity, field, ''))) for field in fields]))
+            lines.append('\t'.join([str(entity.__fields__[field].format(get_field_value(entity, field, mapped), config=config)) for field in fields]))
+
+        click.echo('\n'.join(lines))
         return
 
     table = PrettyTable()
@@ -41,11 +47,58 @@ def entity_listing(cls, fields=('id', 'name',), obj=None):  # type: (typing.Unio
     table.align = 'l'
 
     for entity in entities:
-        table.add_row([str(entity.__fields__[field].format(getattr(entity, field, ''))) for field in fields])
+        table.add_row([str(entity.__fields__[field].format(get_field_value(entity, field, mapped), config=config)) for field in fields])
 
     click.echo(table)
 
 
+def fetch_mapped_fields(entities, fields, config=None):  # type: (typing.Sequence[base.Entity], typing.Sequence, typing.Any) -> typing.Dict[str, typing.Dict]
+    """
+    Fetches entities linked through MappingFields which are going to be displayed. The distinct linked entities are
+    fetched concurrently and only once, so the listing does not have to wait for API call for every listed entity.
+
+    Returns dict with structure 'name of the field' => {'ID of linked entity' => linked entity}.
+    See get_field_value().
+    """
+    mapped = {}
+    if not entities:
+        return mapped
+
+    entity_fields = entities[0].__fields__
+    for field_name in fields:
+        field = entity_fields.get(field_name)
+        if not isinstance(field, model_fields.MappingField):
+            continue
+
+        ids = {entity.__dict__.get(field.mapped_field) for entity in entities} - {None}
+        objects = field.mapped_cls.objects
+
+        if objects.can_get_detail or not objects.can_get_list:
+            # Only IDs which failed to be prefetched are fetched again
+            prefetched = objects.prefetch(ids, config=config)
+            mapped[field_name] = {eid: prefetched[eid] if eid in prefetched else objects.get(eid, config=config)
+                                  for eid in ids}
+        else:
+            # Without detail endpoint every get() would download the whole list, so lets download it only once
+            mapped[field_name] = {entity.id: entity for entity in objects.all(config=config) if entity.id in ids}
+
+    return mapped
+
+
+def get_field_value(entity, field_name, mapped, default=''):  # type: (base.Entity, str, typing.Dict, typing.Any) -> typing.Any
+    """
+    Returns value of the entity's field, where linked entities are looked up in the 'mapped' dict
+    returned by fetch_mapped_fields().
+    """
+    if field_name in mapped:
+        eid = entity.__dict__.get(entity.__fields__[field_name].mapped_field)
+
+        if eid is not None:
+            return mapped[field_name].get(eid)
+
+    return getattr(entity, field_name, default)
+
+
 def get_entity(cls, org_spec, field_lookup, multiple=False, workspace=None, config=None):
     for field in field_lookup:
         # If the passed SPEC is not valid value for the field --> skip
@@ -85,26 +138,27 @@ def entity_detail(cls, spec, field_lookup=('id', 'name',), primary_field='name',
     entity_dict = {}
     for field in entity.__fields__.values():
         if field.read:
-            entity_dict[field.name] = field.format(getattr(entity, field.name, ''))
+            entity_dict[field.name] = field.format(getattr(entity, field.name, ''), config=config)
 
     del entity_dict[primary_field]
     del entity_dict['id']
 
-    entity_string = ''
+    header = obj.get('header')
+    lines = []
     for key, value in sorted(entity_dict.items()):
-        if obj.get('header'):
-            entity_string += '\n{}: {}'.format(
+        if header:
+            lines.append('{}: {}'.format(
                 click.style(key.replace('_', ' ').capitalize(), **theme.header),
                 '' if value is None else value
-            )
+            ))
         else:
-            entity_string += '\n' + str(value)
+            lines.append(str(value))
 
     click.echo("""{} {}
 {}""".format(
         click.style(getattr(entity, primary_field, ''), **theme.title),
         click.style('#' + str(entity.id),  **theme.title_id),
-        entity_string[1:]))
+        '\n'.join(lines)))
 
 
 def entity_remove(cls, spec, field_lookup=('id', 'name',), obj=None):
@@ -206,6 +260,7 @@ def parse_duration_string(value):
     return base
 
 
+@lru_cache(maxsize=4096)
 def format_duration(duration):
     if isinstance(duration, int):
         duration = pendulum.duration(seconds=duration)
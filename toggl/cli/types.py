@@ -216,10 +216,7 @@ class FieldsType(click.ParamType):
 
             # Remove field
             if modifier == '-':
-                try:
-                    del out[field]
-                except KeyError:
-                    pass
+                out.pop(field, None)
 
         return out.keys()
 
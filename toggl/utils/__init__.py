@@ -1,2 +1,2 @@
-from toggl.utils.others import toggl, SubCommandsGroup
+from toggl.utils.others import toggl, SubCommandsGroup, MAX_CONCURRENT_REQUESTS
 from toggl.utils.config import Config
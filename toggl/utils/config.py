@@ -122,7 +122,7 @@ class IniConfigMixin:
             if value is not None:
                 return value
 
-        return super(IniConfigMixin, self).__getattribute__(item)
+        return super().__getattribute__(item)
 
     @property
     def is_loaded(self):  # type: () -> bool
@@ -172,7 +172,7 @@ class EnvConfigMixin:
 
     def __init__(self, read_env=True, **kwargs):  # type: (bool, **typing.Any) -> None
         self._read_env = read_env
-        super(EnvConfigMixin, self).__init__(**kwargs)
+        super().__init__(**kwargs)
 
     def _resolve_variable(self, entry):  # type: (EnvEntry) -> typing.Any
         """
@@ -1,5 +1,5 @@
 import logging
-import json
+from http.cookiejar import DefaultCookiePolicy
 from pprint import pformat
 from time import sleep
 
@@ -11,6 +11,17 @@ from toggl import exceptions
 
 logger = logging.getLogger('toggl.utils')
 
+# Maximal number of concurrent API calls (eq. when prefetching entities), which also sizes the connection pool
+MAX_CONCURRENT_REQUESTS = 4
+
+# Shared session so that consecutive calls (and the prefetching thread pool) reuse
+# kept-alive connections instead of paying for new TCP + TLS handshake every time.
+# Authentication stays per-request as it depends on the used Config, and because of the same reason
+# the session must not persist cookies, otherwise cookies set for one credentials would be sent with others.
+_session = requests.Session()
+_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_session.mount('https://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS))
+
 
 class SubCommandsGroup(click.Group):
     """
@@ -126,15 +137,17 @@ def handle_error(response):
 
 
 def _toggl_request(url, method, data, headers, auth):
-    logger.info('Sending {} to \'{}\' data: {}'.format(method.upper(), url, json.dumps(data)))
+    # Data are already serialized JSON string, there is no need to encode them again just for logging
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Sending {} to \'{}\' data: {}'.format(method.upper(), url, data))
     if method == 'delete':
-        response = requests.delete(url, auth=auth, data=data, headers=headers)
+        response = _session.delete(url, auth=auth, data=data, headers=headers)
     elif method == 'get':
-        response = requests.get(url, auth=auth, data=data, headers=headers)
+        response = _session.get(url, auth=auth, data=data, headers=headers)
     elif method == 'post':
-        response = requests.post(url, auth=auth, data=data, headers=headers)
+        response = _session.post(url, auth=auth, data=data, headers=headers)
     elif method == 'put':
-        response = requests.put(url, auth=auth, data=data, headers=headers)
+        response = _session.put(url, auth=auth, data=data, headers=headers)
     else:
         raise NotImplementedError('HTTP method "{}" not implemented.'.format(method))
 
@@ -163,10 +176,17 @@ def toggl(url, method, data=None, headers=None, config=None, address=None):
     exception = None
     for _ in range(tries):
         try:
-            logger.debug('Default workspace: {}'.format(config._default_workspace))
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug('Default workspace: {}'.format(config._default_workspace))
+
             response = _toggl_request(url, method, data, headers, config.get_auth())
             response_json = response.json()
-            logger.debug('Response {}:\n{}'.format(response.status_code, pformat(response_json)))
+
+            # Pretty-printing of the whole response is expensive, so do it only when it is going to be logged
+            if debug:
+                logger.debug('Response {}:\n{}'.format(response.status_code, pformat(response_json)))
+
             return response_json
         except (exceptions.TogglThrottlingException, requests.exceptions.ConnectionError) as e:
             sleep(0.1)  # Lets give Toggl API some time to recover